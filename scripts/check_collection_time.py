@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Collection Time Check - Guard pytest collection speed
+
+This script times ``pytest --collect-only`` on the test suite and fails when
+the median wall time over several runs exceeds a threshold, so regressions
+in collection (slow imports, plugin overhead, marker explosions) are caught
+before they quietly slow down every test run.
+
+Usage:
+    python scripts/check_collection_time.py
+    python scripts/check_collection_time.py --threshold 3 --runs 5
+    python scripts/check_collection_time.py tests/unit tests/integration
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+_COLLECT_ARGS = [
+    "--collect-only",
+    "-q",
+    "-n0",
+    "--no-cov",
+    "-p",
+    "no:cacheprovider",
+    "--continue-on-collection-errors",
+]
+
+
+def time_collection(paths: List[str]) -> float:
+    """Run one pytest collection pass and return its wall time in seconds."""
+    command = [sys.executable, "-m", "pytest", *paths, *_COLLECT_ARGS]
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=PROJECT_ROOT, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+
+    if result.returncode not in (0, 5):
+        # Collection errors are reported but only the timing is gated here
+        summary = result.stdout.strip().splitlines()[-1:] or ["no output"]
+        print(f"warning: pytest exited with {result.returncode}: {summary[0]}")
+
+    return elapsed
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Fail when pytest collection is slower than a threshold"
+    )
+    parser.add_argument(
+        "paths", nargs="*", default=["tests/unit"], help="Test paths to collect"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=5.0,
+        help="Maximum median collection time in seconds (default: 5)",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=3,
+        help="Number of collection passes to take the median of (default: 3)",
+    )
+
+    args = parser.parse_args()
+
+    timings = [time_collection(args.paths) for _ in range(max(1, args.runs))]
+    median = statistics.median(timings)
+
+    print(
+        f"pytest collection of {' '.join(args.paths)}: median {median:.2f}s "
+        f"over {len(timings)} runs (threshold {args.threshold:.2f}s)"
+    )
+
+    if median > args.threshold:
+        print("Collection time exceeds threshold")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -307,6 +307,19 @@ def turbo(
         "--exclude",
         help="Regex patterns to exclude URLs (can be used multiple times)",
     ),
+    fast: bool = typer.Option(
+        False,
+        "--fast",
+        help="Only extract links and titles from pages above the max depth",
+    ),
+    visited_filter_capacity: Optional[int] = typer.Option(
+        None,
+        "--visited-filter-capacity",
+        help=(
+            "Track visited URLs in a fixed-size Bloom filter sized for this many "
+            "URLs (for very large crawls; may skip a few unseen pages)"
+        ),
+    ),
 ):
     """High-performance web scraping with intelligent content processing."""
     import psutil
@@ -349,6 +362,9 @@ def turbo(
         f"Cross-domain crawling: {'allowed' if allow_cross_domain else 'same domain only'}"
     )
     console.print(f"Real-time stats: {'enabled' if show_stats else 'disabled'}")
+    console.print(f"Fast mode: {'enabled' if fast else 'disabled'}")
+    if visited_filter_capacity:
+        console.print(f"Visited URL filter capacity: {visited_filter_capacity}")
 
     if exclude_patterns:
         console.print(f"Exclude patterns: {', '.join(exclude_patterns)}")
@@ -372,6 +388,8 @@ def turbo(
                 max_connections_per_host=max_connections_per_host,
                 show_stats=show_stats,
                 exclude_patterns=exclude_patterns,
+                fast_mode=fast,
+                visited_filter_capacity=visited_filter_capacity,
             )
 
             run_id = await engine.run(input_file, max_pages=max_pages, max_depth=depth)
@@ -4,6 +4,7 @@ Automatically detects content type and uses the most appropriate parsing method.
 """
 
 import hashlib
+import html as html_module
 import io
 import re
 import tempfile
@@ -12,7 +13,7 @@ from typing import TYPE_CHECKING, Dict, List, Optional, Set, Union
 
 import aiohttp
 import structlog
-from selectolax.parser import HTMLParser
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
 
 from ..config.settings import settings
 from ..utils.validators import URLValidator
@@ -70,6 +71,57 @@ except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
 
+# Lightweight extractors used by parse_html_fast (no DOM construction)
+_A_HREF_RE = re.compile(r"""<a\b[^>]*?\shref\s*=\s*["']([^"']+)""", re.IGNORECASE)
+_TITLE_RE = re.compile(r"<title[^>]*>([^<]{0,512})</title>", re.IGNORECASE)
+_META_DESC_RE = re.compile(
+    r"""<meta[^>]+name=["']description["'][^>]+content=["']([^"']*)""",
+    re.IGNORECASE,
+)
+
+
+# Ordered rewrites turning page HTML into structured plain text
+_HTML_TEXT_SUBSTITUTIONS = tuple(
+    (re.compile(pattern, flags), replacement)
+    for pattern, replacement, flags in (
+        # Remove script and style content
+        (r"<script[^>]*>.*?</script>", "", re.DOTALL | re.IGNORECASE),
+        (r"<style[^>]*>.*?</style>", "", re.DOTALL | re.IGNORECASE),
+        (r"<noscript[^>]*>.*?</noscript>", "", re.DOTALL | re.IGNORECASE),
+        # Headers get double newlines for better spacing
+        (r"<h[1-6][^>]*>", "\n\n", re.IGNORECASE),
+        (r"</h[1-6]>", "\n\n", re.IGNORECASE),
+        # Paragraphs and divs
+        (r"<p[^>]*>", "\n", re.IGNORECASE),
+        (r"</p>", "\n", re.IGNORECASE),
+        (r"<div[^>]*>", "\n", re.IGNORECASE),
+        (r"</div>", "\n", re.IGNORECASE),
+        # List items
+        (r"<li[^>]*>", "\n• ", re.IGNORECASE),
+        (r"</li>", "\n", re.IGNORECASE),
+        # Line breaks
+        (r"<br[^>]*>", "\n", re.IGNORECASE),
+        (r"<hr[^>]*>", "\n---\n", re.IGNORECASE),
+        # Sections and articles
+        (r"<(section|article)[^>]*>", "\n\n", re.IGNORECASE),
+        (r"</(section|article)>", "\n\n", re.IGNORECASE),
+        # Remove all remaining HTML tags
+        (r"<[^>]+>", " ", 0),
+    )
+)
+
+# Whitespace cleanup applied after entity decoding
+_WHITESPACE_SUBSTITUTIONS = (
+    # Remove excessive spaces within lines
+    (re.compile(r"[ \t]+"), " "),
+    # Remove spaces at the beginning and end of lines
+    (re.compile(r"^ +", re.MULTILINE), ""),
+    (re.compile(r" +$", re.MULTILINE), ""),
+    # Remove excessive blank lines
+    (re.compile(r"\n{3,}"), "\n\n"),
+)
+
+
 class ContentParser:
     """
     Comprehensive content parser that automatically handles all content types:
@@ -478,6 +530,45 @@ class ContentParser:
             self.logger.error(f"HTML content parsing failed: {e}")
             return self._empty_result()
 
+    def parse_html_fast(self, content: str, base_url: str) -> Dict:
+        """
+        Extract only title, meta description and links from HTML.
+
+        Skips DOM construction, body text and content hashing, for pages
+        that are only needed to expand the crawl frontier.
+
+        Args:
+            content: HTML content to scan
+            base_url: Base URL for resolving relative links
+
+        Returns:
+            Parsing result with the same keys as a full parse
+        """
+        result = self._empty_result()
+
+        title_match = _TITLE_RE.search(content)
+        if title_match:
+            title = html_module.unescape(title_match.group(1)).strip()
+            result["title"] = title or None
+
+        meta_match = _META_DESC_RE.search(content)
+        if meta_match:
+            result["meta_description"] = html_module.unescape(
+                meta_match.group(1)
+            ).strip()
+
+        links: Set[str] = set()
+        for href in _A_HREF_RE.findall(content):
+            href = html_module.unescape(href).strip()
+            if href:
+                self._add_link(href, base_url, links, "a-tag")
+
+        result["links"] = list(links)
+        result["link_count"] = len(links)
+        result["content_length"] = len(content)
+
+        return result
+
     async def _init_browser(self):
         """Initialize Playwright browser if needed."""
         if not self.playwright:
@@ -731,19 +822,19 @@ class ContentParser:
         """Extract heading tags."""
         headers = {"h1": [], "h2": [], "h3": []}
 
-        for level in ["h1", "h2", "h3"]:
-            for header in parser.css(level):
-                text = header.text().strip()
-                if text:
-                    headers[level].append(text)
+        for header in parser.css("h1, h2, h3"):
+            text = header.text().strip()
+            if text:
+                headers[header.tag].append(text)
 
         return headers
 
     def _extract_body_text(self, parser: HTMLParser) -> str:
         """Extract clean body text with better formatting preservation."""
         # Remove non-content elements
-        for tag in parser.css("script, style, nav, footer, aside, noscript, iframe"):
-            tag.decompose()
+        parser.strip_tags(
+            ["script", "style", "nav", "footer", "aside", "noscript", "iframe"]
+        )
 
         # Find main content
         main_content = parser.css_first(
@@ -764,58 +855,14 @@ class ContentParser:
         if not html:
             return ""
 
-        import re
-
-        # Remove script and style content
-        html = re.sub(
-            r"<script[^>]*>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE
-        )
-        html = re.sub(
-            r"<style[^>]*>.*?</style>", "", html, flags=re.DOTALL | re.IGNORECASE
-        )
-        html = re.sub(
-            r"<noscript[^>]*>.*?</noscript>", "", html, flags=re.DOTALL | re.IGNORECASE
-        )
-
-        # Replace block elements with newlines
-        # Headers get double newlines for better spacing
-        html = re.sub(r"<h[1-6][^>]*>", "\n\n", html, flags=re.IGNORECASE)
-        html = re.sub(r"</h[1-6]>", "\n\n", html, flags=re.IGNORECASE)
-
-        # Paragraphs and divs
-        html = re.sub(r"<p[^>]*>", "\n", html, flags=re.IGNORECASE)
-        html = re.sub(r"</p>", "\n", html, flags=re.IGNORECASE)
-        html = re.sub(r"<div[^>]*>", "\n", html, flags=re.IGNORECASE)
-        html = re.sub(r"</div>", "\n", html, flags=re.IGNORECASE)
-
-        # List items
-        html = re.sub(r"<li[^>]*>", "\n• ", html, flags=re.IGNORECASE)
-        html = re.sub(r"</li>", "\n", html, flags=re.IGNORECASE)
-
-        # Line breaks
-        html = re.sub(r"<br[^>]*>", "\n", html, flags=re.IGNORECASE)
-        html = re.sub(r"<hr[^>]*>", "\n---\n", html, flags=re.IGNORECASE)
-
-        # Sections and articles
-        html = re.sub(r"<(section|article)[^>]*>", "\n\n", html, flags=re.IGNORECASE)
-        html = re.sub(r"</(section|article)>", "\n\n", html, flags=re.IGNORECASE)
-
-        # Remove all remaining HTML tags
-        html = re.sub(r"<[^>]+>", " ", html)
+        for pattern, replacement in _HTML_TEXT_SUBSTITUTIONS:
+            html = pattern.sub(replacement, html)
 
         # Decode HTML entities
-        import html as html_module
-
         text = html_module.unescape(html)
 
-        # Clean up whitespace
-        # Remove excessive spaces within lines
-        text = re.sub(r"[ \t]+", " ", text)
-        # Remove spaces at the beginning and end of lines
-        text = re.sub(r"^ +", "", text, flags=re.MULTILINE)
-        text = re.sub(r" +$", "", text, flags=re.MULTILINE)
-        # Remove excessive blank lines
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        for pattern, replacement in _WHITESPACE_SUBSTITUTIONS:
+            text = pattern.sub(replacement, text)
 
         return text.strip()
 
@@ -1,15 +1,42 @@
 """HTML content parser for extracting metadata and links."""
 
 import hashlib
+import json
+import re
 from typing import Dict, List, Optional, Set
 
 import structlog
-from selectolax.parser import HTMLParser
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
 
 from ..utils.validators import URLValidator
 
 logger = structlog.get_logger()
 
+# Precompiled patterns for pulling URLs out of inline JavaScript
+_SCRIPT_URL_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'["\']([^"\']*/[^"\']*)["\']',  # General URL-like strings
+        r'href\s*:\s*["\']([^"\']+)["\']',  # href properties
+        r'url\s*:\s*["\']([^"\']+)["\']',  # url properties
+        r'path\s*:\s*["\']([^"\']+)["\']',  # path properties
+        r'route\s*:\s*["\']([^"\']+)["\']',  # route properties
+        r'to\s*:\s*["\']([^"\']+)["\']',  # to properties (React Router)
+    )
+)
+_QUOTED_STRING_RE = re.compile(r'["\']([^"\']+)["\']')
+_SCRIPT_URL_EXCLUDED_PREFIXES = ("javascript:", "data:", "blob:", "#")
+_SCRIPT_URL_EXCLUDED_SUFFIXES = (
+    ".js",
+    ".css",
+    ".png",
+    ".jpg",
+    ".gif",
+    ".svg",
+    ".woff",
+    ".ttf",
+)
+
 
 class ContentParser:
     """Parses HTML content to extract metadata and links."""
@@ -115,18 +142,16 @@ class ContentParser:
         """Extract heading tags."""
         headers = {"h1": [], "h2": [], "h3": []}
 
-        for level in ["h1", "h2", "h3"]:
-            for header in parser.css(level):
-                text = header.text().strip()
-                if text:
-                    headers[level].append(text)
+        for header in parser.css("h1, h2, h3"):
+            text = header.text().strip()
+            if text:
+                headers[header.tag].append(text)
 
         return headers
 
     def _extract_body_text(self, parser: HTMLParser) -> str:
         """Extract clean body text."""
-        for tag in parser.css("script, style, nav, footer, aside"):
-            tag.decompose()
+        parser.strip_tags(["script", "style", "nav", "footer", "aside"])
 
         main_content = parser.css_first("main, article, .content, #content")
         if main_content:
@@ -205,9 +230,7 @@ class ContentParser:
             onclick = onclick_elem.attributes.get("onclick", "").strip()
             if "location.href" in onclick or "window.location" in onclick:
                 # Simple regex-like extraction for URLs in onclick
-                import re
-
-                url_matches = re.findall(r'["\']([^"\']+)["\']', onclick)
+                url_matches = _QUOTED_STRING_RE.findall(onclick)
                 for match in url_matches:
                     if "/" in match and not match.startswith("javascript:"):
                         self._add_link(match, base_url, links, "onclick-handler")
@@ -246,9 +269,6 @@ class ContentParser:
         self, parser: HTMLParser, base_url: str, links: Set[str]
     ) -> None:
         """Extract URLs from JavaScript code and JSON-LD scripts."""
-        import json
-        import re
-
         for script in parser.css("script"):
             script_content = script.text()
             if not script_content:
@@ -266,38 +286,14 @@ class ContentParser:
 
             # Extract URLs from regular JavaScript
             else:
-                # Look for URL patterns in JavaScript strings
-                url_patterns = [
-                    r'["\']([^"\']*(?:\/[^"\']*)+)["\']',  # General URL-like strings
-                    r'href\s*:\s*["\']([^"\']+)["\']',  # href properties
-                    r'url\s*:\s*["\']([^"\']+)["\']',  # url properties
-                    r'path\s*:\s*["\']([^"\']+)["\']',  # path properties
-                    r'route\s*:\s*["\']([^"\']+)["\']',  # route properties
-                    r'to\s*:\s*["\']([^"\']+)["\']',  # to properties (React Router)
-                ]
-
-                for pattern in url_patterns:
-                    matches = re.findall(pattern, script_content, re.IGNORECASE)
-                    for match in matches:
+                for pattern in _SCRIPT_URL_PATTERNS:
+                    for match in pattern.findall(script_content):
                         # Filter out obvious non-URLs
                         if (
                             len(match) > 1
                             and "/" in match
-                            and not match.startswith(
-                                ("javascript:", "data:", "blob:", "#")
-                            )
-                            and not match.endswith(
-                                (
-                                    ".js",
-                                    ".css",
-                                    ".png",
-                                    ".jpg",
-                                    ".gif",
-                                    ".svg",
-                                    ".woff",
-                                    ".ttf",
-                                )
-                            )
+                            and not match.startswith(_SCRIPT_URL_EXCLUDED_PREFIXES)
+                            and not match.endswith(_SCRIPT_URL_EXCLUDED_SUFFIXES)
                         ):
                             self._add_link(match, base_url, links, "javascript-pattern")
 
@@ -1,12 +1,15 @@
 """Enhanced scraping engine with maximum parallelization."""
 
 import asyncio
+import sys
 import time
 import uuid
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Union
+from urllib.parse import urlparse
 
 import structlog
+from sqlalchemy import insert
 
 from ..config.settings import settings
 from ..core.content_parser import ContentParser
@@ -15,10 +18,15 @@ from ..input.processor import InputProcessor, URLEntry
 from ..storage.database import db_manager
 from ..storage.file_storage import file_storage
 from ..storage.models import Page, ScrapingRun
+from ..utils.bloom import BloomFilter
+from ..utils.frontier import HostRoundRobinQueue
 from ..utils.validators import URLValidator
 
 logger = structlog.get_logger()
 
+# Number of buffered page rows written per bulk INSERT
+_PAGE_INSERT_BATCH_SIZE = 100
+
 
 class ScrapingEngine:
     """High-performance scraping engine with maximum parallelization."""
@@ -33,6 +41,8 @@ class ScrapingEngine:
         show_stats: bool = False,
         debug_links: bool = False,
         exclude_patterns: Optional[List[str]] = None,
+        fast_mode: bool = False,
+        visited_filter_capacity: Optional[int] = None,
     ) -> None:
         """Initialize enhanced scraping engine."""
         self.logger = logger.bind(component="hp_scraping_engine")
@@ -46,6 +56,11 @@ class ScrapingEngine:
         self.max_connections = max_connections
         self.max_connections_per_host = max_connections_per_host
         self.show_stats = show_stats
+        # Only extract links/title for pages that will be expanded further
+        self.fast_mode = fast_mode
+        # Opt-in fixed-memory visited tracking for very large crawls; its
+        # false positives skip real pages, so exact sets stay the default
+        self.visited_filter_capacity = visited_filter_capacity
 
         # Concurrency controls
         self.max_workers = max_workers or (
@@ -53,14 +68,30 @@ class ScrapingEngine:
         )
         self.semaphore = asyncio.Semaphore(self.max_workers)
 
-        # State tracking
-        self._global_visited_urls: Set[str] = set()
+        # Per-run crawl state and metrics
+        self.reset()
+
+        # Multiple HTTP fetchers for better connection pooling
+        self._fetcher_pool_size = min(5, max(1, self.max_workers // 10))
+        self._fetcher_pool: List[HighPerformanceFetcher] = []
+
+    def reset(self) -> None:
+        """Clear per-run crawl state so the engine can be reused."""
+        # Max pages limit for the entire run; run() may override it
+        self._max_pages_limit: Optional[int] = self.max_pages
+        self._fetcher_index = 0
+        self._global_visited_urls: Union[Set[str], BloomFilter]
+        if self.visited_filter_capacity:
+            self._global_visited_urls = BloomFilter(
+                capacity=self.visited_filter_capacity, error_rate=0.001
+            )
+        else:
+            self._global_visited_urls = set()
         self._processing_urls: Set[str] = set()
-        self._url_queue: asyncio.Queue = asyncio.Queue()
+        # Interleave hosts so workers are not all throttled by one domain
+        self._url_queue: asyncio.Queue = HostRoundRobinQueue(key=self._queue_host)
         self._results_queue: asyncio.Queue = asyncio.Queue()
-
-        # Max pages limit for the entire run
-        self._max_pages_limit: Optional[int] = max_pages
+        self._pending_pages: List[Dict[str, Any]] = []
         self._total_urls_queued: int = 0
 
         # Performance metrics
@@ -74,11 +105,6 @@ class ScrapingEngine:
         self._run_start_time: Optional[float] = None
         self._run_end_time: Optional[float] = None
 
-        # Multiple HTTP fetchers for better connection pooling
-        self._fetcher_pool_size = min(5, max(1, self.max_workers // 10))
-        self._fetcher_pool: List[HighPerformanceFetcher] = []
-        self._fetcher_index = 0
-
     async def run(
         self,
         input_file: Path,
@@ -168,9 +194,27 @@ class ScrapingEngine:
 
     async def _initialize_fetcher_pool(self) -> None:
         """Initialize pool of HTTP fetchers for better connection distribution."""
+        # Split the total connection budget across the pool. Each host is
+        # pinned to one fetcher, so every fetcher must still allow a full
+        # per-host allowance or a single-host crawl is capped at its share
+        per_fetcher_connections = None
+        per_host_connections = self.max_connections_per_host
+        if self.max_connections:
+            if per_host_connections is None:
+                # What one HighPerformanceFetcher with the full budget allows
+                per_host_connections = min(50, self.max_connections // 2)
+            per_fetcher_connections = max(
+                1,
+                self.max_connections // self._fetcher_pool_size,
+                per_host_connections,
+            )
+
         self._fetcher_pool = []
         for i in range(self._fetcher_pool_size):
-            fetcher = HighPerformanceFetcher()
+            fetcher = HighPerformanceFetcher(
+                max_connections=per_fetcher_connections,
+                max_connections_per_host=per_host_connections,
+            )
             await fetcher.start_session()
             self._fetcher_pool.append(fetcher)
 
@@ -187,8 +231,27 @@ class ScrapingEngine:
                 self.logger.warning(f"Error closing fetcher session: {e}")
         self._fetcher_pool.clear()
 
-    def _get_next_fetcher(self) -> HighPerformanceFetcher:
-        """Get next fetcher from pool using round-robin."""
+    def _queue_host(self, item: tuple) -> str:
+        """Return the host of a queued (url_entry, depth, parent_id) item."""
+        return self.url_validator.extract_domain(str(item[0].url)) or ""
+
+    def _get_next_fetcher(self, url: Optional[str] = None) -> HighPerformanceFetcher:
+        """
+        Get a fetcher from the pool.
+
+        Args:
+            url: URL about to be fetched. When given, the fetcher is chosen by
+                host so repeat requests reuse that session's keep-alive
+                connections and per-domain rate limiting state.
+
+        Returns:
+            Fetcher to use for the request
+        """
+        if url is not None:
+            domain = self.url_validator.extract_domain(url) or ""
+            return self._fetcher_pool[hash(domain) % len(self._fetcher_pool)]
+
+        # Fall back to round-robin when no URL is known
         fetcher = self._fetcher_pool[self._fetcher_index]
         self._fetcher_index = (self._fetcher_index + 1) % len(self._fetcher_pool)
         return fetcher
@@ -229,18 +292,26 @@ class ScrapingEngine:
             # Wait for remaining results to be processed
             await self._results_queue.join()
 
-            # Cancel result processor and stats reporter
-            result_processor.cancel()
-            stats_reporter.cancel()
+        except Exception as e:
+            self.logger.error("Error in parallel scraping", error=str(e))
+            raise
 
-            # Wait for cancellation to complete
+        finally:
+            # Stop background tasks on success, error and cancellation alike
+            for task in (*workers, result_processor, stats_reporter):
+                task.cancel()
             await asyncio.gather(
                 *workers, result_processor, stats_reporter, return_exceptions=True
             )
 
-        except Exception as e:
-            self.logger.error("Error in parallel scraping", error=str(e))
-            raise
+            # Content files for buffered rows are already on disk, so write
+            # the rows even when the crawl failed or was cancelled
+            try:
+                await self.flush_pending()
+            except Exception as flush_error:
+                self.logger.error(
+                    "Failed to flush buffered page rows", error=str(flush_error)
+                )
 
     async def _worker(self, run_id: str, max_depth: int, worker_id: int) -> None:
         """
@@ -304,6 +375,12 @@ class ScrapingEngine:
         if normalized_url in self._processing_urls:
             return
 
+        # Check loop prevention before marking, as the visited filter
+        # cannot forget a URL once it has been added
+        if self._should_skip_url_for_loop_prevention(url, None, depth):
+            worker_logger.debug("Skipping URL due to loop prevention", url=url)
+            return
+
         # Mark as being processed AND visited immediately to prevent duplicates
         self._processing_urls.add(normalized_url)
         self._global_visited_urls.add(normalized_url)
@@ -311,15 +388,8 @@ class ScrapingEngine:
         try:
             start_time = time.time()
 
-            # Check loop prevention
-            if self._should_skip_url_for_loop_prevention(url, None, depth):
-                worker_logger.debug("Skipping URL due to loop prevention", url=url)
-                # Remove from visited since we're not actually processing it
-                self._global_visited_urls.discard(normalized_url)
-                return
-
-            # Get fetcher from pool
-            fetcher = self._get_next_fetcher()
+            # Get the fetcher that owns this URL's host
+            fetcher = self._get_next_fetcher(url)
 
             # Scrape URL
             page_id = str(uuid.uuid4())
@@ -330,7 +400,10 @@ class ScrapingEngine:
                 status_code, content, headers = await fetcher.fetch(url)
 
                 parsed_data = await self._parse_content_if_successful(
-                    status_code, content, url
+                    status_code,
+                    content,
+                    url,
+                    links_only=self.fast_mode and depth < max_depth,
                 )
 
                 # Store result
@@ -456,19 +529,24 @@ class ScrapingEngine:
                     )
 
                     if result["type"] == "page_result":
-                        await self._store_page_result(
-                            result["page_id"],
-                            result["url"],
-                            result["run_id"],
-                            result["status_code"],
-                            result["parsed_data"],
-                            result["headers"],
-                            referer_url=None,
-                            depth=result["depth"],
-                            parent_id=result.get("parent_id"),
-                            error=result.get("error"),
-                            content=result.get("content"),
+                        # Buffer the page row; it is written in bulk
+                        self._pending_pages.append(
+                            self._build_page_row(
+                                result["page_id"],
+                                result["url"],
+                                result["run_id"],
+                                result["status_code"],
+                                result["parsed_data"],
+                                result["headers"],
+                                referer_url=None,
+                                depth=result["depth"],
+                                parent_id=result.get("parent_id"),
+                                error=result.get("error"),
+                                content=result.get("content"),
+                            )
                         )
+                        if len(self._pending_pages) >= _PAGE_INSERT_BATCH_SIZE:
+                            await self.flush_pending()
 
                         # Save content if successful
                         if result["content"] and result["status_code"] == 200:
@@ -528,20 +606,20 @@ class ScrapingEngine:
         # Note: Don't check _global_visited_urls here as it's already checked in _process_single_url
         # This function only checks for path-based loops
 
-        # Path-based loop detection
+        # Path-based loop detection: single pass with early exit on the
+        # first segment seen more than twice, adjacent or not (/a/b/a/b/a/b)
         try:
-            from urllib.parse import urlparse
-
-            parsed = urlparse(url)
-            path_parts = parsed.path.strip("/").split("/")
+            path_parts = urlparse(url).path.strip("/").split("/")
 
             if len(path_parts) > 1:
-                from collections import Counter
-
-                segment_counts = Counter(path_parts)
-                for segment, count in segment_counts.items():
-                    if segment and count > 2:
+                segment_counts: Dict[str, int] = {}
+                for segment in path_parts:
+                    if not segment:
+                        continue
+                    count = segment_counts.get(segment, 0) + 1
+                    if count > 2:
                         return True
+                    segment_counts[segment] = count
         except Exception:
             pass
 
@@ -560,13 +638,19 @@ class ScrapingEngine:
         return url_entries
 
     async def _parse_content_if_successful(
-        self, status_code: int, content: Union[str, bytes], url: str
+        self,
+        status_code: int,
+        content: Union[str, bytes],
+        url: str,
+        links_only: bool = False,
     ) -> Dict:
         """Parse content if request was successful."""
         if status_code != 200 or not content:
             return {}
 
         try:
+            if links_only and isinstance(content, str):
+                return self.content_parser.parse_html_fast(content, url)
             return await self.content_parser.parse(content, url)
         except Exception as e:
             self.logger.error("Content parsing failed", url=url, error=str(e))
@@ -612,7 +696,7 @@ class ScrapingEngine:
                 scraping_run.error_message = error_message
                 await session.commit()
 
-    async def _store_page_result(
+    def _build_page_row(
         self,
         page_id: str,
         url: str,
@@ -625,41 +709,117 @@ class ScrapingEngine:
         depth: int = 0,
         parent_id: Optional[str] = None,
         content: Optional[str] = None,
-    ) -> None:
-        """Store page result in database."""
+    ) -> Dict[str, Any]:
+        """Build the column values for a Page row."""
         if parsed_data is None:
             parsed_data = {}
         if headers is None:
             headers = {}
 
-        try:
-            from urllib.parse import urlparse
+        domain = self.url_validator.extract_domain(url) or ""
 
-            parsed_url = urlparse(url)
-            domain = parsed_url.netloc.lower()
-        except Exception:
-            domain = "unknown"
-
-        page = Page(
-            id=page_id,
-            url=url,
-            scraping_run_id=run_id,
-            parent_id=parent_id,
-            domain=domain,
-            status_code=status_code,
-            depth=depth,
-            referer_url=referer_url,
-            content_hash=parsed_data.get("content_hash"),
-            title=parsed_data.get("title"),
-            meta_description=parsed_data.get("meta_description"),
-            content_type=headers.get("content-type"),
-            content_length=len(content) if content else 0,
-            retry_count=0,
-            last_error=error,
+        return {
+            "id": page_id,
+            "url": url,
+            "scraping_run_id": run_id,
+            "parent_id": parent_id,
+            "domain": domain,
+            "status_code": status_code,
+            "depth": depth,
+            # Many children share one referer, so store a single copy of it
+            "referer_url": sys.intern(referer_url) if referer_url else None,
+            "content_hash": parsed_data.get("content_hash"),
+            "title": parsed_data.get("title"),
+            "meta_description": parsed_data.get("meta_description"),
+            "content_type": headers.get("content-type"),
+            "content_length": len(content) if content else 0,
+            "retry_count": 0,
+            "last_error": error,
+        }
+
+    async def _store_page_result(
+        self,
+        page_id: str,
+        url: str,
+        run_id: str,
+        status_code: int = 500,
+        parsed_data: dict = None,
+        headers: dict = None,
+        referer_url: Optional[str] = None,
+        error: Optional[str] = None,
+        depth: int = 0,
+        parent_id: Optional[str] = None,
+        content: Optional[str] = None,
+    ) -> None:
+        """
+        Store a single page result in the database immediately.
+
+        The crawl loop buffers rows through _result_processor and
+        flush_pending instead; this single-row path is kept for direct
+        callers and the tests that exercise row construction.
+        """
+        await self._store_page_row(
+            self._build_page_row(
+                page_id,
+                url,
+                run_id,
+                status_code,
+                parsed_data,
+                headers,
+                referer_url=referer_url,
+                error=error,
+                depth=depth,
+                parent_id=parent_id,
+                content=content,
+            )
         )
 
+    async def _store_page_row(self, row: Dict[str, Any]) -> None:
+        """Insert one page row in its own session."""
+        async with db_manager.session() as session:
+            session.add(Page(**row))
+            await session.commit()
+
+    async def flush_pending(self) -> None:
+        """
+        Write all buffered page results to the database.
+
+        Rows go in one bulk INSERT. If that fails, each row is retried on
+        its own so one bad row cannot block the rest; rows that still fail
+        are logged and dropped rather than kept for the next flush.
+        """
+        if not self._pending_pages:
+            return
+
+        rows = self._pending_pages
+        self._pending_pages = []
+        try:
+            await self._store_page_results_bulk(rows)
+        except asyncio.CancelledError:
+            # Keep the rows so the final flush after cancellation writes them
+            self._pending_pages[:0] = rows
+            raise
+        except Exception as e:
+            self.logger.warning(
+                "Bulk page insert failed, storing rows one at a time",
+                rows=len(rows),
+                error=str(e),
+            )
+            for row in rows:
+                try:
+                    await self._store_page_row(row)
+                except Exception as row_error:
+                    self.logger.error(
+                        "Dropping page row that could not be stored",
+                        page_id=row["id"],
+                        url=row["url"],
+                        error=str(row_error),
+                    )
+
+    async def _store_page_results_bulk(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert page rows with a single executemany INSERT."""
         async with db_manager.session() as session:
-            session.add(page)
+            await session.execute(insert(Page), rows)
             await session.commit()
 
     def get_final_stats(self) -> Dict[str, Any]:
@@ -1,16 +1,40 @@
 """Input processing for web scraping URLs."""
 
 import csv
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Set
 
 import structlog
-from pydantic import BaseModel, HttpUrl, field_validator
+from pydantic import BaseModel, HttpUrl, TypeAdapter, field_validator
 
 from content_collector.utils.validators import URLValidator
 
 logger = structlog.get_logger(__name__)
 
+_url_validator = URLValidator()
+_http_url_adapter = TypeAdapter(HttpUrl)
+
+
+@lru_cache(maxsize=100_000)
+def _validated_url(raw: str) -> HttpUrl:
+    """
+    Parse a URL string into an HttpUrl, caching the result per distinct input.
+
+    Callers must already have checked ``raw`` with URLValidator.is_valid_url.
+    The normalized URL is checked again, because pydantic rewrites hosts
+    such as ``0x7f000001`` or ``127.1`` into dotted IPs that the raw check
+    cannot see. This mirrors URLEntry's field validator, which
+    ``model_construct`` skips.
+
+    Raises:
+        ValueError: If the URL fails to parse or its normalized form is invalid
+    """
+    url = _http_url_adapter.validate_python(raw)
+    if not _url_validator.is_valid_url(str(url)):
+        raise ValueError(f"Invalid URL: {url}")
+    return url
+
 
 class URLEntry(BaseModel):
     """Model for validated URL entries."""
@@ -22,9 +46,8 @@ class URLEntry(BaseModel):
     @classmethod
     def validate_url(cls, v):
         """Validate URL using URLValidator."""
-        validator = URLValidator()
         url_str = str(v)
-        if not validator.is_valid_url(url_str):
+        if not _url_validator.is_valid_url(url_str):
             raise ValueError(f"Invalid URL: {url_str}")
         return v
 
@@ -138,7 +161,9 @@ class InputProcessor:
 
                     if self.url_validator.is_valid_url(url_str):
                         try:
-                            url_entry = URLEntry(url=url_str, description=description)
+                            url_entry = URLEntry.model_construct(
+                                url=_validated_url(url_str), description=description
+                            )
                             urls.append(url_entry)
                         except Exception as e:
                             self.logger.warning(
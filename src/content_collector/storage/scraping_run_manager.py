@@ -141,12 +141,15 @@ class ScrapingRunManager:
         Returns:
             Page ID for the stored page
         """
-        # Generate content hash
+        # Empty pages get no hash; otherwise reuse the parser's hash of the
+        # body text when it computed one
         content_hash = None
         if parsed_content and parsed_content.get("body_text"):
-            content_hash = hashlib.sha256(
-                parsed_content["body_text"].encode("utf-8")
-            ).hexdigest()
+            content_hash = parsed_content.get("content_hash")
+            if not content_hash:
+                content_hash = hashlib.sha256(
+                    parsed_content["body_text"].encode("utf-8")
+                ).hexdigest()
 
         # Extract domain from URL
         from urllib.parse import urlparse
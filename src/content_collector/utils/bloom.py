@@ -0,0 +1,75 @@
+"""Fixed-size Bloom filter for tracking large sets of strings."""
+
+import hashlib
+import math
+from typing import Iterator
+
+
+class BloomFilter:
+    """Probabilistic set of strings with a fixed memory footprint.
+
+    Membership tests never return false negatives. Once ``capacity`` items
+    have been added, false positives occur at roughly ``error_rate``.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001) -> None:
+        """
+        Initialize an empty Bloom filter.
+
+        Args:
+            capacity: Expected number of distinct items
+            error_rate: Target false positive rate at full capacity
+
+        Raises:
+            ValueError: If capacity or error_rate is out of range
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._num_bits = max(
+            8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        )
+        self._num_hashes = max(1, round(self._num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self._num_bits + 7) // 8)
+        self._count = 0
+
+    def _indexes(self, item: str) -> Iterator[int]:
+        """Yield the bit positions for an item using double hashing."""
+        # blake2b is stable across processes, unlike the salted built-in hash()
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self._num_hashes):
+            yield (h1 + i * h2) % self._num_bits
+
+    def add(self, item: str) -> None:
+        """Add an item to the filter."""
+        bits = self._bits
+        added = False
+        for index in self._indexes(item):
+            byte, mask = index >> 3, 1 << (index & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                added = True
+        if added:
+            self._count += 1
+
+    def clear(self) -> None:
+        """Remove all items from the filter."""
+        self._bits = bytearray(len(self._bits))
+        self._count = 0
+
+    def __contains__(self, item: str) -> bool:
+        """Check whether an item has (probably) been added."""
+        bits = self._bits
+        return all(
+            bits[index >> 3] & (1 << (index & 7)) for index in self._indexes(item)
+        )
+
+    def __len__(self) -> int:
+        """Return the approximate number of distinct items added."""
+        return self._count
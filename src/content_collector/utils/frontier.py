@@ -0,0 +1,76 @@
+"""Crawl frontier queue that interleaves URLs from different hosts."""
+
+import asyncio
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, Iterator
+
+
+class _HostFrontier:
+    """Per-host FIFO deques served in round-robin host order."""
+
+    def __init__(self, key: Callable[[Any], Hashable]) -> None:
+        self._key = key
+        self._hosts: Dict[Hashable, Deque[Any]] = {}
+        self._ready: Deque[Hashable] = deque()
+        self._size = 0
+
+    def append(self, item: Any) -> None:
+        host = self._key(item)
+        pending = self._hosts.get(host)
+        if pending is None:
+            pending = self._hosts[host] = deque()
+            self._ready.append(host)
+        pending.append(item)
+        self._size += 1
+
+    def popleft(self) -> Any:
+        host = self._ready.popleft()
+        pending = self._hosts[host]
+        item = pending.popleft()
+        if pending:
+            self._ready.append(host)
+        else:
+            del self._hosts[host]
+        self._size -= 1
+        return item
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        # Same order as repeated popleft calls; asyncio.Queue's repr needs this
+        pending = [list(self._hosts[host]) for host in self._ready]
+        for index in range(max(map(len, pending), default=0)):
+            for items in pending:
+                if index < len(items):
+                    yield items[index]
+
+
+class HostRoundRobinQueue(asyncio.Queue):
+    """
+    asyncio.Queue that yields one item per host in turn.
+
+    Items from the same host keep their FIFO order, but consecutive gets
+    cycle across hosts, so concurrent workers spread over many hosts
+    instead of queueing behind one host's rate limit.
+    """
+
+    def __init__(self, key: Callable[[Any], Hashable], maxsize: int = 0) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            key: Function mapping a queued item to its host
+            maxsize: Maximum number of queued items, 0 for unbounded
+        """
+        self._key = key
+        super().__init__(maxsize)
+
+    def _init(self, maxsize: int) -> None:
+        self._queue = _HostFrontier(self._key)
+
+    def _put(self, item: Any) -> None:
+        self._queue.append(item)
+
+    def _get(self) -> Any:
+        return self._queue.popleft()
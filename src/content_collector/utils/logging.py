@@ -2,11 +2,16 @@
 
 import logging
 import sys
-from typing import Any, Optional
+import threading
+from typing import Any, Optional, Tuple
 
 import structlog
 from structlog.processors import JSONRenderer
 
+# Configuration applied by the last successful setup_logging call
+_configured_key: Optional[Tuple[int, bool, Optional[str]]] = None
+_configure_lock = threading.Lock()
+
 
 def setup_logging(
     level: str = "INFO",
@@ -16,6 +21,8 @@ def setup_logging(
     component: Optional[str] = None,
 ) -> Any:
     """Setup structured logging with proper configuration."""
+    global _configured_key
+
     if debug:
         log_level = logging.DEBUG
     else:
@@ -28,38 +35,42 @@ def setup_logging(
         }
         log_level = level_map.get(level.upper(), logging.INFO)
 
-    if file_path:
-        logging.basicConfig(
-            format="%(message)s",
-            filename=file_path,
-            level=log_level,
-        )
-    else:
-        logging.basicConfig(
-            format="%(message)s",
-            stream=sys.stdout,
-            level=log_level,
-        )
+    config_key = (log_level, json_logs, file_path)
+    with _configure_lock:
+        if _configured_key != config_key:
+            if file_path:
+                logging.basicConfig(
+                    format="%(message)s",
+                    filename=file_path,
+                    level=log_level,
+                )
+            else:
+                logging.basicConfig(
+                    format="%(message)s",
+                    stream=sys.stdout,
+                    level=log_level,
+                )
 
-    renderer = JSONRenderer() if json_logs else structlog.dev.ConsoleRenderer()
+            renderer = JSONRenderer() if json_logs else structlog.dev.ConsoleRenderer()
 
-    structlog.configure(
-        processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            renderer,
-        ],
-        context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
-        cache_logger_on_first_use=True,
-    )
+            structlog.configure(
+                processors=[
+                    structlog.stdlib.filter_by_level,
+                    structlog.stdlib.add_logger_name,
+                    structlog.stdlib.add_log_level,
+                    structlog.stdlib.PositionalArgumentsFormatter(),
+                    structlog.processors.TimeStamper(fmt="iso"),
+                    structlog.processors.StackInfoRenderer(),
+                    structlog.processors.format_exc_info,
+                    structlog.processors.UnicodeDecoder(),
+                    renderer,
+                ],
+                context_class=dict,
+                logger_factory=structlog.stdlib.LoggerFactory(),
+                wrapper_class=structlog.stdlib.BoundLogger,
+                cache_logger_on_first_use=True,
+            )
+            _configured_key = config_key
 
     logger = structlog.get_logger()
     if component:
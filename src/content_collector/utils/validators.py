@@ -1,13 +1,174 @@
 """URL validation and processing utilities."""
 
 import re
+import sys
+from functools import lru_cache
 from typing import List, Optional
-from urllib.parse import urljoin, urlparse, urlunparse
+from urllib.parse import urljoin, urlparse, urlsplit, urlunparse
 
 import structlog
 
 logger = structlog.get_logger()
 
+_EXCLUDED_EXTENSIONS = frozenset(
+    {
+        ".doc",
+        ".docx",
+        ".xls",
+        ".xlsx",
+        ".ppt",
+        ".pptx",
+        ".zip",
+        ".rar",
+        ".tar",
+        ".tar.gz",
+        ".tar.xz",
+        ".tar.bz2",
+        ".tgz",
+        ".txz",
+        ".tbz2",
+        ".gz",
+        ".xz",
+        ".bz2",
+        ".7z",
+        ".mp3",
+        ".wav",
+        ".mp4",
+        ".avi",
+        ".mov",
+        ".wmv",
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".bmp",
+        ".svg",
+        ".exe",
+        ".msi",
+        ".dmg",
+        ".deb",
+        ".rpm",
+        ".pkg",
+    }
+)
+
+_LOCALHOST_PATTERNS = (
+    "localhost",
+    "127.0.0.1",
+    "0.0.0.0",
+    "::1",
+    "local.",
+    ".local",
+)
+
+_API_PATTERNS = (
+    "/api/",
+    "/rest/",
+    "/graphql",
+    "/rpc/",
+    ".json",
+    ".xml",
+    ".csv",
+    ".rss",
+    ".atom",
+    "api.",
+    "rest.",
+    "graphql.",
+)
+
+_NON_HTML_PATTERNS = (
+    "mailto:",
+    "tel:",
+    "ftp:",
+    "javascript:",
+    "/download/",
+    "/file/",
+    "/asset/",
+)
+
+
+def _fast_host(url: str) -> Optional[str]:
+    """Scan the netloc out of a plain ``scheme://host/...`` URL.
+
+    Returns None when the URL needs full parsing (no ``://``, an unusual
+    scheme, or characters that urlsplit would strip or reject).
+    """
+    i = url.find("://")
+    if i <= 0 or not url[:i].isalnum():
+        return None
+    start = i + 3
+    end = len(url)
+    for delimiter in ("/", "?", "#"):
+        k = url.find(delimiter, start, end)
+        if k != -1:
+            end = k
+    host = url[start:end]
+    if not host or "[" in host or not host.isprintable() or " " in host:
+        return None
+    return host.lower()
+
+
+@lru_cache(maxsize=100_000)
+def _extract_domain(url: str) -> Optional[str]:
+    """Extract the lowercased netloc of a URL, cached per URL string.
+
+    Hosts are interned so every page from the same site shares one string.
+    """
+    host = _fast_host(url)
+    if host is not None:
+        return sys.intern(host)
+    try:
+        parsed = urlsplit(url)
+        return sys.intern(parsed.netloc.lower()) if parsed.netloc else None
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=100_000)
+def _normalize_url(url: str) -> str:
+    """Normalize a URL, cached per URL string."""
+    try:
+        # urlparse (not urlsplit) so ";params" stay off the normalized path
+        parsed = urlparse(url.strip())
+
+        path = parsed.path
+        if not path:
+            path = "/"
+        else:
+            normalized_parts = []
+            for part in path.split("/"):
+                if part == "..":
+                    if normalized_parts and normalized_parts[-1] != "..":
+                        normalized_parts.pop()
+                elif part and part != ".":
+                    normalized_parts.append(part)
+            path = "/" + "/".join(normalized_parts)
+            if not path.endswith("/") and url.endswith("/"):
+                path += "/"
+
+        return urlunparse(
+            (
+                parsed.scheme.lower(),
+                parsed.netloc.lower(),
+                path,
+                parsed.params,
+                parsed.query,
+                "",
+            )
+        )
+
+    except Exception:
+        return url
+
+
+@lru_cache(maxsize=100_000)
+def _resolve_relative_url(base_url: str, relative_url: str) -> str:
+    """Resolve a relative URL against a base URL, cached per pair."""
+    try:
+        return urljoin(base_url, relative_url)
+    except Exception:
+        return relative_url
+
 
 class URLValidator:
     """Validates and normalizes URLs."""
@@ -31,45 +192,7 @@ class URLValidator:
                 except re.error as e:
                     self.logger.error(f"Invalid regex pattern '{pattern}': {e}")
 
-        self.excluded_extensions = {
-            ".doc",
-            ".docx",
-            ".xls",
-            ".xlsx",
-            ".ppt",
-            ".pptx",
-            ".zip",
-            ".rar",
-            ".tar",
-            ".tar.gz",
-            ".tar.xz",
-            ".tar.bz2",
-            ".tgz",
-            ".txz",
-            ".tbz2",
-            ".gz",
-            ".xz",
-            ".bz2",
-            ".7z",
-            ".mp3",
-            ".wav",
-            ".mp4",
-            ".avi",
-            ".mov",
-            ".wmv",
-            ".jpg",
-            ".jpeg",
-            ".png",
-            ".gif",
-            ".bmp",
-            ".svg",
-            ".exe",
-            ".msi",
-            ".dmg",
-            ".deb",
-            ".rpm",
-            ".pkg",
-        }
+        self.excluded_extensions = _EXCLUDED_EXTENSIONS
 
     def is_valid_url(self, url: str) -> bool:
         """
@@ -91,7 +214,7 @@ class URLValidator:
             return False
 
         try:
-            parsed = urlparse(url)
+            parsed = urlsplit(url)
 
             if parsed.scheme not in ("http", "https"):
                 return False
@@ -102,7 +225,7 @@ class URLValidator:
             if self._is_local_or_ip_address(parsed.netloc):
                 return False
 
-            if self._has_excluded_extension(url):
+            if self._has_excluded_extension(url, parsed.path):
                 return False
 
             if self._is_non_html_resource(url):
@@ -127,40 +250,7 @@ class URLValidator:
         Returns:
             Normalized URL
         """
-        try:
-            parsed = urlparse(url.strip())
-
-            path = parsed.path
-            if not path or path == "":
-                path = "/"
-            else:
-                parts = path.split("/")
-                normalized_parts = []
-                for part in parts:
-                    if part == "..":
-                        if normalized_parts and normalized_parts[-1] != "..":
-                            normalized_parts.pop()
-                    elif part and part != ".":
-                        normalized_parts.append(part)
-                path = "/" + "/".join(normalized_parts)
-                if not path.endswith("/") and url.endswith("/"):
-                    path += "/"
-
-            normalized = urlunparse(
-                (
-                    parsed.scheme.lower(),
-                    parsed.netloc.lower(),
-                    path,
-                    parsed.params,
-                    parsed.query,
-                    "",
-                )
-            )
-
-            return normalized
-
-        except Exception:
-            return url
+        return _normalize_url(url)
 
     def resolve_relative_url(self, base_url: str, relative_url: str) -> str:
         """
@@ -173,10 +263,7 @@ class URLValidator:
         Returns:
             Absolute URL
         """
-        try:
-            return urljoin(base_url, relative_url)
-        except Exception:
-            return relative_url
+        return _resolve_relative_url(base_url, relative_url)
 
     def extract_domain(self, url: str) -> Optional[str]:
         """
@@ -188,11 +275,7 @@ class URLValidator:
         Returns:
             Domain name or None if invalid
         """
-        try:
-            parsed = urlparse(url)
-            return parsed.netloc.lower() if parsed.netloc else None
-        except Exception:
-            return None
+        return _extract_domain(url)
 
     def is_same_domain(self, url1: str, url2: str) -> bool:
         """
@@ -223,7 +306,7 @@ class URLValidator:
         """Check if URL or netloc is localhost or IP address."""
         if url_or_netloc.startswith(("http://", "https://")):
             try:
-                parsed = urlparse(url_or_netloc)
+                parsed = urlsplit(url_or_netloc)
                 netloc = parsed.netloc
             except Exception:
                 return False
@@ -232,15 +315,7 @@ class URLValidator:
 
         netloc_lower = netloc.lower()
 
-        localhost_patterns = [
-            "localhost",
-            "127.0.0.1",
-            "0.0.0.0",
-            "::1",
-            "local.",
-            ".local",
-        ]
-        if any(pattern in netloc_lower for pattern in localhost_patterns):
+        if any(pattern in netloc_lower for pattern in _LOCALHOST_PATTERNS):
             return True
 
         parts = netloc.split(":")[0].split(".")
@@ -275,17 +350,25 @@ class URLValidator:
                 )
         return False
 
-    def _has_excluded_extension(self, url: str) -> bool:
-        """Check if URL has excluded file extension."""
-        try:
-            parsed = urlparse(url)
-            path = parsed.path.lower()
-
-            # Sort extensions by length (longest first) to match compound extensions first
-            sorted_extensions = sorted(self.excluded_extensions, key=len, reverse=True)
+    def _has_excluded_extension(self, url: str, path: Optional[str] = None) -> bool:
+        """Check if URL has excluded file extension.
 
-            for ext in sorted_extensions:
-                if path.endswith(ext):
+        Args:
+            url: URL to check
+            path: Already-parsed path of ``url``, to avoid parsing it again
+        """
+        try:
+            if path is None:
+                path = urlsplit(url).path
+            # Drop ";params" from the last segment, as urlparse would
+            filename = path.lower().rsplit("/", 1)[-1].split(";", 1)[0]
+
+            # Compound extensions (.tar.gz) always end in an excluded
+            # single extension, so checking the last suffix is sufficient
+            dot_index = filename.rfind(".")
+            if dot_index != -1:
+                ext = filename[dot_index:]
+                if ext in self.excluded_extensions:
                     self.logger.debug(
                         "URL excluded due to extension", url=url, extension=ext
                     )
@@ -300,33 +383,10 @@ class URLValidator:
         """Check if URL points to non-HTML resource."""
         url_lower = url.lower()
 
-        api_patterns = [
-            "/api/",
-            "/rest/",
-            "/graphql",
-            "/rpc/",
-            ".json",
-            ".xml",
-            ".csv",
-            ".rss",
-            ".atom",
-            "api.",
-            "rest.",
-            "graphql.",
-        ]
-        if any(pattern in url_lower for pattern in api_patterns):
+        if any(pattern in url_lower for pattern in _API_PATTERNS):
             return True
 
-        non_html_patterns = [
-            "mailto:",
-            "tel:",
-            "ftp:",
-            "javascript:",
-            "/download/",
-            "/file/",
-            "/asset/",
-        ]
-        if any(pattern in url_lower for pattern in non_html_patterns):
+        if any(pattern in url_lower for pattern in _NON_HTML_PATTERNS):
             return True
 
         return False
@@ -6,6 +6,7 @@ for unit, integration, and end-to-end tests.
 """
 
 import asyncio
+import os
 import shutil
 import tempfile
 from pathlib import Path
@@ -16,10 +17,50 @@ import pytest
 TEST_DATABASE_URL = "sqlite:///test_content_collector.db"
 
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+_EVENT_LOOP_POLICIES = {"asyncio": asyncio.DefaultEventLoopPolicy}
+if uvloop is not None:
+    _EVENT_LOOP_POLICIES["uvloop"] = uvloop.EventLoopPolicy
+
+
+@pytest.fixture(
+    scope="session",
+    params=list(_EVENT_LOOP_POLICIES.values()),
+    ids=list(_EVENT_LOOP_POLICIES),
+)
+def event_loop_policy(request):
+    """Run async tests under each available event loop implementation."""
+    return request.param()
+
+
+def pytest_collection_modifyitems(config, items):
+    """Run only coroutine tests under the extra event loop policies."""
+    default_policy = asyncio.DefaultEventLoopPolicy
+    kept, deselected = [], []
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        policy = callspec.params.get("event_loop_policy") if callspec else None
+        if (
+            policy is not None
+            and policy is not default_policy
+            and not asyncio.iscoroutinefunction(getattr(item, "obj", None))
+        ):
+            deselected.append(item)
+        else:
+            kept.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = kept
+
+
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
+def event_loop(event_loop_policy):
+    """Create an event loop from the current policy for the test session."""
+    loop = event_loop_policy.new_event_loop()
     yield loop
     loop.close()
 
@@ -32,6 +73,30 @@ def temp_dir() -> Generator[Path, None, None]:
     shutil.rmtree(temp_path, ignore_errors=True)
 
 
+@pytest.fixture
+def temp_storage_dir() -> Generator[str, None, None]:
+    """Create a temporary storage directory, on tmpfs when available."""
+    base_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    temp_path = tempfile.mkdtemp(dir=base_dir)
+    yield temp_path
+    shutil.rmtree(temp_path, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def shared_scraping_engine():
+    """Build one ScrapingEngine for the whole session."""
+    from content_collector.core.scraper import ScrapingEngine
+
+    return ScrapingEngine()
+
+
+@pytest.fixture
+def scraping_engine(shared_scraping_engine):
+    """Provide the shared ScrapingEngine with per-run state cleared."""
+    shared_scraping_engine.reset()
+    return shared_scraping_engine
+
+
 @pytest.fixture
 async def test_db_manager():
     """Initialize a test database manager."""
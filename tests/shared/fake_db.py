@@ -0,0 +1,63 @@
+"""Lightweight stand-ins for the database manager used in unit tests."""
+
+from typing import Any, List, Optional, Tuple
+
+
+class FakeSession:
+    """Session double that records calls without building mocks."""
+
+    def __init__(self) -> None:
+        self.get_result: Any = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget recorded calls and the configured ``get`` result."""
+        self.added: List[Any] = []
+        self.executed: List[Tuple[Any, ...]] = []
+        self.gets: List[Tuple[Any, Any]] = []
+        self.commits = 0
+        self.get_result = None
+
+    def add(self, instance: Any) -> None:
+        self.added.append(instance)
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def get(self, model: Any, ident: Any) -> Any:
+        self.gets.append((model, ident))
+        return self.get_result
+
+    async def execute(self, statement: Any, params: Optional[Any] = None) -> None:
+        self.executed.append((statement, params))
+
+
+class _SessionContext:
+    """Async context manager handing out a shared FakeSession."""
+
+    def __init__(self, session: FakeSession) -> None:
+        self._session = session
+
+    async def __aenter__(self) -> FakeSession:
+        return self._session
+
+    async def __aexit__(self, *exc_info: Any) -> bool:
+        return False
+
+
+class FakeDBManager:
+    """Database manager double whose ``session()`` reuses one FakeSession."""
+
+    def __init__(self) -> None:
+        self.fake_session = FakeSession()
+        self._context = _SessionContext(self.fake_session)
+
+    async def initialize(self) -> None:
+        pass
+
+    def session(self) -> _SessionContext:
+        return self._context
+
+    def reset(self) -> None:
+        """Clear everything recorded by the shared session."""
+        self.fake_session.reset()
@@ -0,0 +1,52 @@
+"""Tests for the Bloom filter utility."""
+
+import pytest
+
+from content_collector.utils.bloom import BloomFilter
+
+
+class TestBloomFilter:
+    """Test Bloom filter membership tracking."""
+
+    def test_add_and_contains(self):
+        """Test added items are reported as members."""
+        bloom = BloomFilter(capacity=1000)
+        bloom.add("https://example.com/")
+
+        assert "https://example.com/" in bloom
+        assert "https://example.org/" not in bloom
+        assert len(bloom) == 1
+
+    def test_duplicate_add_not_counted(self):
+        """Test adding the same item twice counts it once."""
+        bloom = BloomFilter(capacity=1000)
+        bloom.add("example.com")
+        bloom.add("example.com")
+
+        assert len(bloom) == 1
+
+    def test_false_positive_rate_within_bound(self):
+        """Test the false positive rate stays near the target at capacity."""
+        bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+        for i in range(10_000):
+            bloom.add(f"https://example.com/page{i}")
+
+        false_positives = sum(
+            f"https://example.org/page{i}" in bloom for i in range(10_000)
+        )
+        assert false_positives < 300
+
+    def test_clear(self):
+        """Test clearing removes all items."""
+        bloom = BloomFilter(capacity=1000)
+        bloom.add("example.com")
+        bloom.clear()
+
+        assert "example.com" not in bloom
+        assert len(bloom) == 0
+
+    @pytest.mark.parametrize("capacity,error_rate", [(0, 0.01), (100, 0), (100, 1)])
+    def test_invalid_parameters(self, capacity, error_rate):
+        """Test invalid sizing parameters are rejected."""
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=capacity, error_rate=error_rate)
@@ -82,6 +82,31 @@ class TestContentParser:
         assert "Content here" in result["body_text"]
         assert "https://example.com" in result["links"]
 
+    def test_parse_html_fast(self, parser):
+        """Test link-only HTML parsing without building a DOM."""
+        html = """
+        <html>
+            <head>
+                <title>Fast &amp; Light</title>
+                <meta name="description" content="Test description">
+            </head>
+            <body>
+                <p>Content here</p>
+                <a class="nav" href="/about">About</a>
+                <a href="#top">Top</a>
+            </body>
+        </html>
+        """
+
+        result = parser.parse_html_fast(html, "https://test.com")
+
+        assert result["title"] == "Fast & Light"
+        assert result["meta_description"] == "Test description"
+        assert result["links"] == ["https://test.com/about"]
+        assert result["link_count"] == 1
+        assert result["body_text"] == ""
+        assert result["content_hash"] == ""
+
     @pytest.mark.asyncio
     async def test_parse_html_url(self, parser):
         """Test parsing HTML from URL."""
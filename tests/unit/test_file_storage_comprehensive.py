@@ -3,8 +3,8 @@ Comprehensive tests for file storage functionality.
 """
 
 import os
-import shutil
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -14,13 +14,6 @@ import pytest
 class TestFileStorageBasics:
     """Test basic file storage functionality."""
 
-    @pytest.fixture
-    def temp_storage_dir(self):
-        """Create temporary storage directory for testing."""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        shutil.rmtree(temp_dir, ignore_errors=True)
-
     def test_file_storage_module_import(self):
         """Test that file storage module can be imported."""
         try:
@@ -153,44 +146,49 @@ class TestFileStorageUtilities:
         total_size = calculate_directory_size(temp_storage_dir)
         assert total_size > 0
 
-    @pytest.fixture
-    def temp_storage_dir(self):
-        """Create temporary storage directory for testing."""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        shutil.rmtree(temp_dir, ignore_errors=True)
-
-    def test_file_cleanup_by_age(self, temp_storage_dir):
+    def test_file_cleanup_by_age(self):
         """Test file cleanup by age."""
-        import time
-
-        def cleanup_old_files(directory, max_age_days=7):
+        fixed_now = 1_700_000_000.0
+        day = 24 * 60 * 60
+        directory = "/storage"
+        mtimes = {
+            "/storage/old_file.txt": fixed_now - 10 * day,
+            "/storage/new_file.txt": fixed_now - 1 * day,
+        }
+        removed = []
+
+        def cleanup_old_files(
+            directory,
+            max_age_days=7,
+            clock=time.time,
+            stat_fn=os.path.getmtime,
+            walk_fn=os.walk,
+            remove_fn=os.remove,
+        ):
             """Clean up files older than max_age_days."""
-            import os
-            import time
-
-            cutoff_time = time.time() - (max_age_days * 24 * 60 * 60)
+            cutoff_time = clock() - (max_age_days * 24 * 60 * 60)
             deleted_count = 0
 
-            for root, dirs, files in os.walk(directory):
+            for root, dirs, files in walk_fn(directory):
                 for file in files:
                     file_path = os.path.join(root, file)
-                    if os.path.getmtime(file_path) < cutoff_time:
-                        os.remove(file_path)
+                    if stat_fn(file_path) < cutoff_time:
+                        remove_fn(file_path)
                         deleted_count += 1
 
             return deleted_count
 
-        test_file = os.path.join(temp_storage_dir, "old_file.txt")
-        with open(test_file, "w") as f:
-            f.write("old content")
-
-        old_time = time.time() - (10 * 24 * 60 * 60)
-        os.utime(test_file, (old_time, old_time))
-
-        deleted_count = cleanup_old_files(temp_storage_dir, max_age_days=7)
-
-        assert deleted_count >= 0
+        deleted_count = cleanup_old_files(
+            directory,
+            max_age_days=7,
+            clock=lambda: fixed_now,
+            stat_fn=lambda path: mtimes[path],
+            walk_fn=lambda d: [(d, [], ["old_file.txt", "new_file.txt"])],
+            remove_fn=removed.append,
+        )
+
+        assert deleted_count == 1
+        assert removed == ["/storage/old_file.txt"]
 
     def test_archive_creation(self, temp_storage_dir):
         """Test archive creation functionality."""
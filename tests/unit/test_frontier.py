@@ -0,0 +1,64 @@
+"""Tests for the host round-robin crawl frontier."""
+
+import pytest
+
+from content_collector.utils.frontier import HostRoundRobinQueue
+
+
+def _host(url: str) -> str:
+    return url.split("/")[2]
+
+
+class TestHostRoundRobinQueue:
+    """Test host interleaving in the frontier queue."""
+
+    @pytest.mark.asyncio
+    async def test_gets_cycle_across_hosts(self):
+        """Test consecutive gets alternate hosts while keeping per-host order."""
+        queue = HostRoundRobinQueue(key=_host)
+        for url in [
+            "https://a.com/1",
+            "https://a.com/2",
+            "https://a.com/3",
+            "https://b.com/1",
+            "https://c.com/1",
+        ]:
+            await queue.put(url)
+
+        assert queue.qsize() == 5
+        order = [await queue.get() for _ in range(5)]
+
+        assert order == [
+            "https://a.com/1",
+            "https://b.com/1",
+            "https://c.com/1",
+            "https://a.com/2",
+            "https://a.com/3",
+        ]
+        assert queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_join_waits_for_task_done(self):
+        """Test join/task_done bookkeeping is inherited from asyncio.Queue."""
+        queue = HostRoundRobinQueue(key=_host)
+        queue.put_nowait("https://a.com/1")
+
+        await queue.get()
+        queue.task_done()
+
+        await queue.join()
+
+    @pytest.mark.asyncio
+    async def test_iteration_matches_get_order(self):
+        """Test iterating the frontier (as repr does) follows get order."""
+        queue = HostRoundRobinQueue(key=_host)
+        for url in ["https://a.com/1", "https://a.com/2", "https://b.com/1"]:
+            queue.put_nowait(url)
+        await queue.get()
+        queue.put_nowait("https://c.com/1")
+
+        queued = list(queue._queue)
+
+        assert "https://b.com/1" in repr(queue)
+        assert queued == ["https://b.com/1", "https://a.com/2", "https://c.com/1"]
+        assert queued == [await queue.get() for _ in range(3)]
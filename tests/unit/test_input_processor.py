@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from content_collector.input.processor import InputProcessor, URLEntry
+from content_collector.input.processor import InputProcessor, URLEntry, _validated_url
 
 
 class TestInputProcessor:
@@ -72,3 +72,30 @@ class TestInputProcessor:
             url_entries = await self.processor.process_input_file(input_file)
         assert len(url_entries) == 1
         assert str(url_entries[0].url) == "https://example.com/"
+
+    @pytest.mark.asyncio
+    async def test_numeric_loopback_hosts_skipped(self):
+        """Test hosts that pydantic normalizes to 127.0.0.1 are rejected."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_file = Path(temp_dir) / "test_urls.csv"
+            csv_file.write_text(
+                "url\n"
+                "https://0x7f000001/\n"
+                "https://2130706433/x\n"
+                "https://127.1/\n"
+                "https://example.com\n"
+            )
+
+            url_entries = await self.processor.process_input_file(csv_file)
+        assert [str(entry.url) for entry in url_entries] == ["https://example.com/"]
+
+    def test_validated_url_is_cached(self):
+        """Test that repeated URL strings reuse the cached validation result."""
+        _validated_url.cache_clear()
+
+        first = _validated_url("https://example.com")
+        second = _validated_url("https://example.com")
+
+        assert first is second
+        assert str(first) == "https://example.com/"
+        assert _validated_url.cache_info().hits == 1
@@ -9,9 +9,16 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+import content_collector.utils.logging as logging_utils
 from content_collector.utils.logging import setup_logging
 
 
+@pytest.fixture(autouse=True)
+def reset_logging_configuration(monkeypatch):
+    """Force each test to start from an unconfigured logging state."""
+    monkeypatch.setattr(logging_utils, "_configured_key", None)
+
+
 class TestStructuredLogging:
     """Test structured logging setup."""
 
@@ -83,6 +90,15 @@ class TestStructuredLogging:
 
         assert True
 
+    def test_repeated_setup_skips_reconfiguration(self):
+        """Test that an unchanged configuration is only applied once."""
+        with patch("structlog.configure") as mock_configure:
+            setup_logging(level="DEBUG")
+            setup_logging(level="DEBUG")
+            setup_logging(level="INFO")
+
+            assert mock_configure.call_count == 2
+
     @patch("structlog.configure")
     def test_processor_configuration(self, mock_configure):
         """Test that processors are properly configured."""
@@ -2,13 +2,14 @@
 
 import asyncio
 from pathlib import Path
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from content_collector.config.settings import settings
 from content_collector.core.scraper import ScrapingEngine
 from content_collector.input.processor import URLEntry
+from tests.shared.fake_db import FakeDBManager
 
 
 class TestLoopPrevention:
@@ -91,43 +92,65 @@ class TestLoopPrevention:
             scraper._should_skip_url_for_loop_prevention(repeated_url, None, 1) is True
         )
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            ("/cat/cat/cat/cat/page", True),
+            ("/docs/v1/docs/v1/docs/v1/", True),
+            ("/a/b/a/b/a/b", True),
+            ("/x/y/x/z/x", True),
+            ("/cat/cat/page", False),
+            ("/a/b/a/c", False),
+            ("/page", False),
+            ("/", False),
+        ],
+    )
+    def test_repeated_path_segments(self, scraper, path, expected):
+        """Test any segment seen three times, adjacent or not, is a loop."""
+        url = f"https://example.com{path}"
+
+        assert scraper._should_skip_url_for_loop_prevention(url, None, 1) is expected
+
     async def test_loop_prevention_in_recursive_scraping(self, scraper):
-        """Test loop prevention integration in recursive scraping."""
+        """Test pages linking back to each other are fetched only once."""
+        links = {
+            "https://example.com/page1": [
+                "https://example.com/page2",
+                "https://example.com/page3",
+            ],
+            "https://example.com/page2": ["https://example.com/page1"],
+            "https://example.com/page3": [
+                "https://example.com/page1",
+                "https://example.com/page2",
+            ],
+        }
+        fetched = []
+
+        class FakeFetcher:
+            async def fetch(self, url):
+                fetched.append(url)
+                return 200, "<html></html>", {}
+
+        async def fake_parse(status_code, content, url, links_only=False):
+            return {"links": links[url]}
+
+        url_entries = [
+            URLEntry(url="https://example.com/page1", description="test"),
+            URLEntry(url="https://example.com/page2", description="test"),
+        ]
+
         with (
-            patch("content_collector.core.scraper.db_manager") as mock_db_manager,
-            patch("content_collector.core.scraper.file_storage") as mock_file_storage,
+            patch("content_collector.core.scraper.db_manager", FakeDBManager()),
+            patch("content_collector.core.scraper.file_storage") as mock_storage,
+            patch.object(scraper, "_get_next_fetcher", return_value=FakeFetcher()),
+            patch.object(scraper, "_parse_content_if_successful", fake_parse),
         ):
+            mock_storage.save_content = AsyncMock()
 
-            mock_session = AsyncMock()
-            mock_db_manager.session.return_value.__aenter__.return_value = mock_session
-
-            mock_session.execute.return_value.scalar_one_or_none.return_value = None
-
-            url_entries = [
-                URLEntry(url="https://example.com/page1", description="test"),
-                URLEntry(url="https://example.com/page2", description="test"),
-            ]
-
-            scraper._scrape_single_url_with_children = AsyncMock()
-            scraper._get_page_id_by_url = AsyncMock(return_value="test-page-id")
-
-            scraper._scrape_single_url_with_children.side_effect = [
-                ["https://example.com/page2", "https://example.com/page3"],
-                ["https://example.com/page1"],
-            ]
-
-            await scraper._scrape_urls_recursive(url_entries, "test-run", 2)
-
-            call_count = scraper._scrape_single_url_with_children.call_count
-            assert call_count > 0, "Should have made some scraping calls"
-            assert (
-                call_count < 10
-            ), "Should not have made excessive calls due to loop prevention"
+            await scraper._parallel_scrape_with_depth(url_entries, "test-run", 2)
 
-            assert (
-                len(scraper._global_visited_urls) > 0
-            ), "Should have tracked visited URLs"
+        assert sorted(fetched) == sorted(links)
+        assert len(scraper._global_visited_urls) == len(links)
 
     def test_loop_prevention_configuration(self, scraper):
         """Test that loop prevention respects configuration settings."""
@@ -6,7 +6,6 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from sqlalchemy import select
 
-from content_collector.core.scraper import ScrapingEngine
 from content_collector.storage.models import Page
 
 
@@ -14,7 +13,7 @@ class TestRefererLogging:
     """Test referer URL logging in scraped pages."""
 
     @pytest.mark.asyncio
-    async def test_referer_url_storage(self, test_db_manager):
+    async def test_referer_url_storage(self, test_db_manager, scraping_engine):
         """Test that referer URLs are properly stored in the database."""
         mock_file_storage = AsyncMock()
 
@@ -26,7 +25,7 @@ class TestRefererLogging:
             patch("content_collector.core.scraper.db_manager", test_db_manager),
             patch("content_collector.core.scraper.file_storage", mock_file_storage),
         ):
-            scraper = ScrapingEngine()
+            scraper = scraping_engine
 
             url = "https://example.com/page"
             referer_url = "https://example.com/parent"
@@ -57,7 +56,9 @@ class TestRefererLogging:
                 assert page.status_code == 200
 
     @pytest.mark.asyncio
-    async def test_referer_url_none_for_root_pages(self, test_db_manager):
+    async def test_referer_url_none_for_root_pages(
+        self, test_db_manager, scraping_engine
+    ):
         """Test that root pages have no referer URL."""
         mock_file_storage = AsyncMock()
 
@@ -68,7 +69,7 @@ class TestRefererLogging:
             patch("content_collector.core.scraper.db_manager", test_db_manager),
             patch("content_collector.core.scraper.file_storage", mock_file_storage),
         ):
-            scraper = ScrapingEngine()
+            scraper = scraping_engine
 
             url = "https://example.com/"
 
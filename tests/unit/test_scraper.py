@@ -1,12 +1,11 @@
 import pytest
 
-from content_collector.core.scraper import ScrapingEngine
 from content_collector.utils.validators import URLValidator
 
 
 @pytest.fixture
-def scraper():
-    return ScrapingEngine()
+def scraper(scraping_engine):
+    return scraping_engine
 
 
 def test_scrape_valid_url(scraper):
@@ -10,6 +10,7 @@ This module demonstrates proper testing practices including:
 """
 
 import asyncio
+from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -17,16 +18,53 @@ import pytest
 
 from content_collector.core.scraper import ScrapingEngine
 from content_collector.input.processor import URLEntry
+from content_collector.utils.bloom import BloomFilter
+from tests.shared.fake_db import FakeDBManager
+
+_INPUT_FILE = Path("test_input.txt")
+_EMPTY_INPUT = Path("empty_input.txt")
+_RUN_ID = "test-run-123"
+_URL = "https://example.com"
+
+_SAMPLE_URL_ENTRIES = tuple(
+    URLEntry(url=f"https://example{i}.com", priority=1, category="test")
+    for i in range(5)
+)
+
+
+@contextmanager
+def _bind(obj, **overrides):
+    """Temporarily set attributes on ``obj``, restoring the originals on exit."""
+    missing = object()
+    saved = {name: vars(obj).get(name, missing) for name in overrides}
+    vars(obj).update(overrides)
+    try:
+        yield overrides
+    finally:
+        for name, value in saved.items():
+            if value is missing:
+                delattr(obj, name)
+            else:
+                setattr(obj, name, value)
+
+
+@pytest.fixture(scope="session")
+def fake_db_manager():
+    """Build one fake database manager for the whole session."""
+    return FakeDBManager()
+
+
+@pytest.fixture(autouse=True)
+def db_session(fake_db_manager, monkeypatch):
+    """Route the scraper's database access to the shared fake session."""
+    fake_db_manager.reset()
+    monkeypatch.setattr("content_collector.core.scraper.db_manager", fake_db_manager)
+    return fake_db_manager.fake_session
 
 
 class TestScrapingEngine:
     """Test suite for ScrapingEngine class."""
 
-    @pytest.fixture
-    def scraping_engine(self):
-        """Create a ScrapingEngine instance for testing."""
-        return ScrapingEngine()
-
     @pytest.fixture
     def mock_url_entry(self):
         """Create a mock URL entry for testing."""
@@ -37,115 +75,79 @@ class TestScrapingEngine:
         """Create a list of sample URL entries."""
         return [mock_url_entry]
 
-    @pytest.mark.asyncio
-    async def test_create_scraping_run_record_success(self, scraping_engine):
+    async def test_create_scraping_run_record_success(
+        self, scraping_engine, db_session
+    ):
         """Test successful creation of scraping run record."""
-        run_id = "test-run-123"
-        input_file = Path("test_input.txt")
         max_depth = 2
 
-        with patch("content_collector.core.scraper.db_manager") as mock_db:
-            mock_session = AsyncMock()
-            mock_db.session.return_value.__aenter__.return_value = mock_session
-
-            await scraping_engine._create_scraping_run_record(
-                run_id, input_file, max_depth
-            )
+        # run() passes the input file path as a string
+        await scraping_engine._create_scraping_run_record(
+            _RUN_ID, str(_INPUT_FILE), max_depth
+        )
 
-            mock_session.add.assert_called_once()
-            mock_session.commit.assert_called_once()
+        assert len(db_session.added) == 1
+        assert db_session.commits == 1
 
-            added_run = mock_session.add.call_args[0][0]
-            assert added_run.id == run_id
-            assert added_run.input_file == str(input_file)
-            assert added_run.status == "running"
+        added_run = db_session.added[0]
+        assert added_run.id == _RUN_ID
+        assert added_run.input_file == str(_INPUT_FILE)
+        assert added_run.status == "running"
 
-    @pytest.mark.asyncio
     async def test_prepare_url_entries_with_limit(self, scraping_engine):
         """Test URL entries preparation with max_pages limit."""
-        input_file = Path("test_input.txt")
         max_pages = 2
 
-        mock_entries = [
-            URLEntry(url=f"https://example{i}.com", priority=1, category="test")
-            for i in range(5)
-        ]
-
         with patch.object(
             scraping_engine.input_processor,
             "process_input_file",
-            return_value=mock_entries,
+            return_value=list(_SAMPLE_URL_ENTRIES),
         ):
-            result = await scraping_engine._prepare_url_entries(input_file, max_pages)
+            result = await scraping_engine._prepare_url_entries(_INPUT_FILE, max_pages)
 
             assert len(result) == max_pages
-            assert result == mock_entries[:max_pages]
+            assert result == list(_SAMPLE_URL_ENTRIES[:max_pages])
 
-    @pytest.mark.asyncio
     async def test_prepare_url_entries_no_urls_found(self, scraping_engine):
         """Test URL entries preparation when no URLs are found."""
-        input_file = Path("empty_input.txt")
-
         with patch.object(
             scraping_engine.input_processor, "process_input_file", return_value=[]
         ):
-            result = await scraping_engine._prepare_url_entries(input_file, None)
+            result = await scraping_engine._prepare_url_entries(_EMPTY_INPUT, None)
 
             assert result == []
 
-    @pytest.mark.asyncio
-    async def test_update_total_urls_count_success(self, scraping_engine):
+    async def test_update_total_urls_count_success(self, scraping_engine, db_session):
         """Test successful update of total URLs count."""
-        run_id = "test-run-123"
         total_urls = 10
+        db_session.get_result = mock_run = MagicMock()
+
+        await scraping_engine._update_total_urls_count(_RUN_ID, total_urls)
+
+        assert mock_run.total_urls == total_urls
+        assert len(db_session.gets) == 1
+        assert db_session.commits == 1
+
+    @pytest.mark.parametrize(
+        "method,status,extra",
+        [
+            ("_mark_run_completed", "completed", {}),
+            ("_mark_run_failed", "failed", {"error_message": "Test error message"}),
+        ],
+    )
+    async def test_mark_run_status(
+        self, scraping_engine, db_session, method, status, extra
+    ):
+        """Test marking a run completed or failed updates it and commits."""
+        db_session.get_result = mock_run = MagicMock()
+
+        await getattr(scraping_engine, method)(_RUN_ID, *extra.values())
+
+        assert mock_run.status == status
+        for attr, value in extra.items():
+            assert getattr(mock_run, attr) == value
+        assert db_session.commits == 1
 
-        with patch("content_collector.core.scraper.db_manager") as mock_db:
-            mock_session = AsyncMock()
-            mock_run = MagicMock()
-            mock_session.get.return_value = mock_run
-            mock_db.session.return_value.__aenter__.return_value = mock_session
-
-            await scraping_engine._update_total_urls_count(run_id, total_urls)
-
-            assert mock_run.total_urls == total_urls
-            mock_session.get.assert_called_once()
-            mock_session.commit.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_mark_run_completed_success(self, scraping_engine):
-        """Test marking run as completed."""
-        run_id = "test-run-123"
-
-        with patch("content_collector.core.scraper.db_manager") as mock_db:
-            mock_session = AsyncMock()
-            mock_run = MagicMock()
-            mock_session.get.return_value = mock_run
-            mock_db.session.return_value.__aenter__.return_value = mock_session
-
-            await scraping_engine._mark_run_completed(run_id)
-
-            assert mock_run.status == "completed"
-            mock_session.commit.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_mark_run_failed_success(self, scraping_engine):
-        """Test marking run as failed with error message."""
-        run_id = "test-run-123"
-        error_message = "Test error message"
-
-        with patch("content_collector.core.scraper.db_manager") as mock_db:
-            mock_session = AsyncMock()
-            mock_run = MagicMock()
-            mock_session.get.return_value = mock_run
-            mock_db.session.return_value.__aenter__.return_value = mock_session
-
-            await scraping_engine._mark_run_failed(run_id, error_message)
-
-            assert mock_run.status == "failed"
-            assert mock_run.error_message == error_message
-            mock_session.commit.assert_called_once()
-
-    @pytest.mark.asyncio
     async def test_parse_content_if_successful_with_content(self, scraping_engine):
         """Test content parsing when request is successful."""
         status_code = 200
@@ -163,7 +165,6 @@ class TestScrapingEngine:
             assert result == expected_data
             mock_parse.assert_called_once_with(content, url)
 
-    @pytest.mark.asyncio
     async def test_parse_content_if_successful_with_error(self, scraping_engine):
         """Test content parsing when request failed."""
         status_code = 404
@@ -176,118 +177,295 @@ class TestScrapingEngine:
 
         assert result == {}
 
-    @pytest.mark.asyncio
-    async def test_store_failed_page_success(self, scraping_engine):
+    async def test_store_failed_page_success(self, scraping_engine, db_session):
         """Test storing failed page attempt."""
         page_id = "page-123"
         url = "https://example.com"
         error = "Connection timeout"
 
-        with patch("content_collector.core.scraper.db_manager") as mock_db:
-            mock_session = AsyncMock()
-            mock_db.session.return_value.__aenter__.return_value = mock_session
+        await scraping_engine._store_page_result(
+            page_id=page_id, url=url, run_id="test-run-id", error=error
+        )
 
-            with patch.object(
-                scraping_engine.url_validator,
-                "extract_domain",
-                return_value="example.com",
-            ):
-                await scraping_engine._store_page_result(
-                    page_id=page_id, url=url, run_id="test-run-id", error=error
+        assert len(db_session.added) == 1
+        assert db_session.commits == 1
+
+        added_page = db_session.added[0]
+        assert added_page.id == page_id
+        assert added_page.url == url
+        assert added_page.domain == "example.com"
+        assert added_page.status_code == 500
+        assert added_page.last_error == error
+        assert added_page.retry_count == 0
+
+    async def test_flush_pending_bulk_inserts_rows(self, scraping_engine, db_session):
+        """Test buffered page rows are written with one bulk INSERT."""
+        scraping_engine._pending_pages = [
+            scraping_engine._build_page_row(f"page-{i}", url, "test-run-id", 200)
+            for i, url in enumerate(["https://example.com", "https://example.org"])
+        ]
+
+        await scraping_engine.flush_pending()
+        await scraping_engine.flush_pending()
+
+        assert len(db_session.executed) == 1
+        assert db_session.commits == 1
+        rows = db_session.executed[0][1]
+        assert [row["id"] for row in rows] == ["page-0", "page-1"]
+        assert scraping_engine._pending_pages == []
+
+    async def test_flush_pending_stores_rows_singly_after_bulk_failure(
+        self, scraping_engine, db_session, monkeypatch
+    ):
+        """Test a failed bulk INSERT retries rows singly and drops bad ones."""
+        scraping_engine._pending_pages = [
+            scraping_engine._build_page_row(f"page-{i}", _URL, "test-run-id", 200)
+            for i in range(3)
+        ]
+        monkeypatch.setattr(
+            db_session, "execute", AsyncMock(side_effect=RuntimeError("bad row"))
+        )
+        add = db_session.add
+
+        def add_rejecting_page_1(page):
+            if page.id == "page-1":
+                raise RuntimeError("bad row")
+            add(page)
+
+        monkeypatch.setattr(db_session, "add", add_rejecting_page_1)
+
+        await scraping_engine.flush_pending()
+
+        assert [page.id for page in db_session.added] == ["page-0", "page-2"]
+        assert scraping_engine._pending_pages == []
+
+    async def test_cancelled_crawl_flushes_buffered_rows(
+        self, scraping_engine, db_session
+    ):
+        """Test rows buffered before a cancellation are still written."""
+        started = asyncio.Event()
+
+        async def hanging_process(*args):
+            started.set()
+            await asyncio.Event().wait()
+
+        scraping_engine._pending_pages = [
+            scraping_engine._build_page_row("page-0", _URL, _RUN_ID, 200)
+        ]
+
+        with _bind(scraping_engine, _process_single_url=hanging_process):
+            crawl = asyncio.create_task(
+                scraping_engine._parallel_scrape_with_depth(
+                    list(_SAMPLE_URL_ENTRIES[:1]), _RUN_ID, 0
                 )
+            )
+            await started.wait()
+            crawl.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await crawl
 
-                mock_session.add.assert_called_once()
-                mock_session.commit.assert_called_once()
+        assert [[row["id"] for row in rows] for _, rows in db_session.executed] == [
+            ["page-0"]
+        ]
+        assert scraping_engine._pending_pages == []
+
+    async def test_result_processor_flushes_final_batch(
+        self, scraping_engine, db_session, monkeypatch
+    ):
+        """Test full batches flush during the run and the remainder at the end."""
+        monkeypatch.setattr("content_collector.core.scraper._PAGE_INSERT_BATCH_SIZE", 2)
+
+        async def fake_process(url_entry, run_id, depth, *args):
+            await scraping_engine._results_queue.put(
+                {
+                    "type": "page_result",
+                    "page_id": str(url_entry.url),
+                    "url": str(url_entry.url),
+                    "run_id": run_id,
+                    "status_code": 200,
+                    "parsed_data": {},
+                    "headers": {},
+                    "depth": depth,
+                    "content": None,
+                }
+            )
+
+        with _bind(scraping_engine, _process_single_url=fake_process):
+            await scraping_engine._parallel_scrape_with_depth(
+                list(_SAMPLE_URL_ENTRIES[:3]), _RUN_ID, 0
+            )
+
+        assert [len(rows) for _, rows in db_session.executed] == [2, 1]
+        assert db_session.commits == 2
+        assert scraping_engine._pending_pages == []
+
+    def test_reset_clears_run_state(self, scraping_engine):
+        """Test reset drops visited URLs, buffered rows and counters."""
+        scraping_engine._global_visited_urls.add("https://example.com/")
+        scraping_engine._pending_pages.append({"id": "page-1"})
+        scraping_engine._total_urls_queued = 3
+        scraping_engine._stats["urls_processed"] = 3
+        scraping_engine._max_pages_limit = 7
+        scraping_engine._fetcher_index = 2
+
+        scraping_engine.reset()
+
+        assert "https://example.com/" not in scraping_engine._global_visited_urls
+        assert scraping_engine._pending_pages == []
+        assert scraping_engine._total_urls_queued == 0
+        assert scraping_engine._stats["urls_processed"] == 0
+        assert scraping_engine._url_queue.empty()
+        assert scraping_engine._max_pages_limit == scraping_engine.max_pages
+        assert scraping_engine._fetcher_index == 0
+
+    def test_filter_child_urls_skips_visited(self, scraping_engine):
+        """Test visited links are dropped and unseen links are kept."""
+        visited = scraping_engine.url_validator.normalize_url(f"{_URL}/a")
+        scraping_engine._global_visited_urls.add(visited)
+
+        children = scraping_engine._filter_child_urls(
+            [f"{_URL}/a", f"{_URL}/b"], f"{_URL}/"
+        )
+
+        assert isinstance(scraping_engine._global_visited_urls, set)
+        assert children == [f"{_URL}/b"]
+
+    def test_visited_filter_capacity_opts_into_bloom_filter(self):
+        """Test the Bloom filter is only used when a capacity is given."""
+        engine = ScrapingEngine(visited_filter_capacity=1_000)
+        engine._global_visited_urls.add(f"{_URL}/")
+
+        engine.reset()
 
-                added_page = mock_session.add.call_args[0][0]
-                assert added_page.id == page_id
-                assert added_page.url == url
-                assert added_page.status_code == 500
-                assert added_page.last_error == error
-                assert added_page.retry_count == 1
+        assert isinstance(engine._global_visited_urls, BloomFilter)
+        assert f"{_URL}/" not in engine._global_visited_urls
+
+    def test_get_next_fetcher_pins_hosts(self, scraping_engine):
+        """Test URLs on the same host always share one fetcher."""
+        pool = [MagicMock() for _ in range(5)]
+
+        with patch.object(scraping_engine, "_fetcher_pool", pool):
+            first = scraping_engine._get_next_fetcher("https://example.com/a")
+            second = scraping_engine._get_next_fetcher("https://EXAMPLE.com/b?c=1")
+
+        assert first is second
+
+    @pytest.mark.parametrize("per_host", [50, None])
+    async def test_fetcher_pool_keeps_per_host_concurrency(self, per_host):
+        """Test a pinned host can still open a full per-host allowance."""
+        engine = ScrapingEngine(
+            max_workers=50, max_connections=100, max_connections_per_host=per_host
+        )
+
+        with patch(
+            "content_collector.core.scraper.HighPerformanceFetcher.start_session",
+            new_callable=AsyncMock,
+        ):
+            await engine._initialize_fetcher_pool()
+
+        fetcher = engine._get_next_fetcher(f"{_URL}/a")
+        assert len(engine._fetcher_pool) == 5
+        assert min(fetcher.max_connections, fetcher.max_connections_per_host) == 50
 
-    @pytest.mark.asyncio
     async def test_scrape_urls_success(self, scraping_engine, sample_url_entries):
         """Test successful URL scraping workflow."""
-        run_id = "test-run-123"
-
         with patch("content_collector.core.scraper.HTTPFetcher") as mock_fetcher_class:
             mock_fetcher = AsyncMock()
             mock_fetcher_class.return_value.__aenter__.return_value = mock_fetcher
 
-            with patch("content_collector.core.scraper.db_manager") as mock_db:
-                mock_session = AsyncMock()
-                mock_db.session.return_value.__aenter__.return_value = mock_session
+            with patch.object(
+                scraping_engine,
+                "_scrape_single_url_with_children",
+                return_value=None,
+            ) as mock_scrape_single:
+                await scraping_engine._scrape_urls_recursive(
+                    sample_url_entries, _RUN_ID, 1
+                )
+
+                assert mock_scrape_single.call_count == len(sample_url_entries)
+
+    def test_parallel_scrape_scheduling_perf(self, scraping_engine, benchmark):
+        """Benchmark queue and worker overhead of the parallel scrape loop."""
+        entries = list(_SAMPLE_URL_ENTRIES * 20)
 
-                with patch.object(
-                    scraping_engine,
-                    "_scrape_single_url_with_children",
-                    return_value=None,
-                ) as mock_scrape_single:
-                    await scraping_engine._scrape_urls_recursive(
-                        sample_url_entries, run_id, 1
-                    )
+        async def scrape():
+            # Queues bind to the loop that first waits on them
+            scraping_engine.reset()
+            await scraping_engine._parallel_scrape_with_depth(entries, "rid", 1)
+
+        # A private loop leaves the loop shared by the async tests untouched,
+        # which asyncio.run() would unset on exit
+        loop = asyncio.new_event_loop()
+
+        def run():
+            mock_process.reset_mock()
+            loop.run_until_complete(scrape())
+
+        try:
+            with patch.object(
+                scraping_engine, "_process_single_url", new_callable=AsyncMock
+            ) as mock_process:
+                benchmark(run)
+        finally:
+            loop.close()
 
-                    assert mock_scrape_single.call_count == len(sample_url_entries)
+        assert mock_process.await_count == len(entries)
 
-    @pytest.mark.asyncio
     async def test_run_full_workflow_success(self, scraping_engine, sample_url_entries):
         """Test the complete run workflow."""
-        input_file = Path("test_input.txt")
         max_pages = None
         max_depth = 1
 
-        with (
-            patch.object(scraping_engine, "_create_scraping_run_record") as mock_create,
-            patch.object(
-                scraping_engine, "_prepare_url_entries", return_value=sample_url_entries
-            ) as mock_prepare,
-            patch.object(scraping_engine, "_update_total_urls_count") as mock_update,
-            patch.object(scraping_engine, "_scrape_urls_recursive") as mock_scrape,
-            patch.object(scraping_engine, "_mark_run_completed") as mock_complete,
-        ):
-
-            run_id = await scraping_engine.run(input_file, max_pages, max_depth)
-
-            mock_create.assert_called_once()
-            mock_prepare.assert_called_once_with(input_file, max_pages)
-            mock_update.assert_called_once_with(run_id, len(sample_url_entries))
-            mock_scrape.assert_called_once_with(sample_url_entries, run_id, max_depth)
-            mock_complete.assert_called_once_with(run_id)
+        with _bind(
+            scraping_engine,
+            _create_scraping_run_record=AsyncMock(),
+            _initialize_fetcher_pool=AsyncMock(),
+            _cleanup_fetcher_pool=AsyncMock(),
+            _prepare_url_entries=AsyncMock(return_value=sample_url_entries),
+            _update_total_urls_count=AsyncMock(),
+            _parallel_scrape_with_depth=AsyncMock(),
+            _mark_run_completed=AsyncMock(),
+        ) as mocks:
+            run_id = await scraping_engine.run(_INPUT_FILE, max_pages, max_depth)
+
+        mocks["_create_scraping_run_record"].assert_called_once()
+        mocks["_prepare_url_entries"].assert_called_once_with(_INPUT_FILE, max_pages)
+        mocks["_update_total_urls_count"].assert_called_once_with(
+            run_id, len(sample_url_entries)
+        )
+        mocks["_parallel_scrape_with_depth"].assert_called_once_with(
+            sample_url_entries, run_id, max_depth
+        )
+        mocks["_mark_run_completed"].assert_called_once_with(run_id)
 
-            assert isinstance(run_id, str)
-            assert len(run_id) > 0
+        assert isinstance(run_id, str)
+        assert len(run_id) > 0
 
-    @pytest.mark.asyncio
     async def test_run_workflow_with_exception(self, scraping_engine):
         """Test run workflow when an exception occurs."""
-        input_file = Path("test_input.txt")
         max_pages = None
         error_message = "Test error"
 
-        with (
-            patch.object(scraping_engine, "_create_scraping_run_record"),
-            patch.object(
-                scraping_engine,
-                "_prepare_url_entries",
-                side_effect=Exception(error_message),
-            ),
-            patch.object(scraping_engine, "_mark_run_failed") as mock_mark_failed,
-        ):
-
+        with _bind(
+            scraping_engine,
+            _create_scraping_run_record=AsyncMock(),
+            _initialize_fetcher_pool=AsyncMock(),
+            _cleanup_fetcher_pool=AsyncMock(),
+            _prepare_url_entries=AsyncMock(side_effect=Exception(error_message)),
+            _mark_run_failed=AsyncMock(),
+        ) as mocks:
             with pytest.raises(Exception, match=error_message):
-                await scraping_engine.run(input_file, max_pages)
+                await scraping_engine.run(_INPUT_FILE, max_pages)
 
-            mock_mark_failed.assert_called_once()
-            call_args = mock_mark_failed.call_args[0]
-            assert call_args[1] == error_message
+        mocks["_mark_run_failed"].assert_called_once()
+        call_args = mocks["_mark_run_failed"].call_args[0]
+        assert call_args[1] == error_message
 
 
 class TestScrapingEngineIntegration:
     """Integration tests for ScrapingEngine with real components."""
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_scraping_engine_initialization(self):
         """Test that ScrapingEngine initializes with all dependencies."""
         engine = ScrapingEngine()
@@ -299,7 +477,6 @@ class TestScrapingEngineIntegration:
 
     @pytest.mark.integration
     @pytest.mark.slow
-    @pytest.mark.asyncio
     async def test_end_to_end_scraping_with_real_urls(self, temp_dir):
         """End-to-end test with real URLs (requires network)."""
         pytest.skip("Network test - implement when network testing is enabled")
@@ -1,6 +1,12 @@
+import hashlib
+
 import pytest
 
 from content_collector.storage.database import DatabaseManager
+from content_collector.storage.scraping_run_manager import ScrapingRunManager
+from tests.shared.fake_db import FakeSession
+
+_BODY_HASH = hashlib.sha256(b"Hello").hexdigest()
 
 
 @pytest.fixture
@@ -19,3 +25,23 @@ def test_database_manager_methods(db_manager):
     """Test that DatabaseManager has expected methods."""
     assert hasattr(db_manager, "create_tables")
     assert hasattr(db_manager, "close")
+
+
+@pytest.mark.parametrize(
+    "parsed_content,expected",
+    [
+        ({"body_text": "Hello", "content_hash": _BODY_HASH}, _BODY_HASH),
+        ({"body_text": "Hello"}, _BODY_HASH),
+        ({"body_text": "", "content_hash": hashlib.sha256(b"").hexdigest()}, None),
+        ({}, None),
+    ],
+)
+async def test_store_page_result_content_hash(parsed_content, expected):
+    """Test pages with an empty body store no content hash."""
+    session = FakeSession()
+
+    await ScrapingRunManager.store_page_result(
+        session, "run-1", "https://example.com/", parsed_content, status_code=200
+    )
+
+    assert session.added[0].content_hash == expected
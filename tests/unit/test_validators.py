@@ -1,70 +1,106 @@
 """Comprehensive tests for URL validation utilities."""
 
+from urllib.parse import urlsplit
+
+import pytest
+
 from content_collector.utils.validators import URLValidator
 from tests.shared.url_validation_mixin import URLValidationTestMixin
 
+_VALIDATION_URLS = tuple(f"https://example.com/page{i}" for i in range(100))
+
+_LOCAL_URLS = (
+    "https://localhost",
+    "https://127.0.0.1",
+    "https://192.168.1.1",
+    "https://10.0.0.1",
+)
+
+_REMOTE_URLS = (
+    "https://example.com",
+    "https://google.com",
+)
+
+_EXTENSION_CASES = (
+    ("https://example.com/file.pdf", True),
+    ("https://example.com/image.JPG", True),
+    ("https://example.com/video.mp4", True),
+    ("https://example.com/archive.ZIP", True),
+    ("https://example.com/page.html", False),
+    ("https://example.com/page", False),
+    ("https://example.com/", False),
+    ("https://example.com/page.php", False),
+)
+
+_PARAMS_NORMALIZATION_CASES = (
+    ("https://EX.com/a/;p", "https://ex.com/a;p"),
+    ("https://ex.com/a/;p?x=1#frag", "https://ex.com/a;p?x=1"),
+    ("https://ex.com/a;x/./b;y", "https://ex.com/a;x/b;y"),
+)
+
 
 class TestURLValidator(URLValidationTestMixin):
     """Test suite for URLValidator class using shared test mixin."""
 
-    def test_is_local_or_ip_address(self, validator):
+    @pytest.fixture(scope="session")
+    def validator(self):
+        """Share one URLValidator across the read-only tests below."""
+        return URLValidator()
+
+    @pytest.mark.parametrize("url", _LOCAL_URLS)
+    def test_is_local_or_ip_address(self, validator, url):
         """Test detection of local/IP addresses."""
-        local_urls = [
-            "https://localhost",
-            "https://127.0.0.1",
-            "https://192.168.1.1",
-            "https://10.0.0.1",
-        ]
-        for url in local_urls:
-            assert validator._is_local_or_ip_address(
-                url
-            ), f"Should detect local/IP address: {url}"
-
-        remote_urls = [
-            "https://example.com",
-            "https://google.com",
-        ]
-        for url in remote_urls:
-            assert not validator._is_local_or_ip_address(
-                url
-            ), f"Should not detect local/IP address: {url}"
+        assert validator._is_local_or_ip_address(url)
+
+    @pytest.mark.parametrize("url", _REMOTE_URLS)
+    def test_is_not_local_or_ip_address(self, validator, url):
+        """Test public hosts are not treated as local/IP addresses."""
+        assert not validator._is_local_or_ip_address(url)
 
-    def test_has_excluded_extension(self, validator):
+    @pytest.mark.parametrize("url,expected", _EXTENSION_CASES)
+    def test_has_excluded_extension(self, validator, url, expected):
         """Test file extension exclusion logic."""
-        excluded_urls = [
-            "https://example.com/file.pdf",
-            "https://example.com/image.JPG",
-            "https://example.com/video.mp4",
-            "https://example.com/archive.ZIP",
-        ]
-        for url in excluded_urls:
-            assert validator._has_excluded_extension(
-                url
-            ), f"Should detect excluded extension in {url}"
-
-        allowed_urls = [
-            "https://example.com/page.html",
-            "https://example.com/page",
-            "https://example.com/",
-            "https://example.com/page.php",
+        assert validator._has_excluded_extension(url) is expected
+
+    @pytest.mark.parametrize("url,expected", _PARAMS_NORMALIZATION_CASES)
+    def test_normalize_url_keeps_params_off_path(self, validator, url, expected):
+        """Test ";params" on the last segment are split off before path cleanup."""
+        assert validator.normalize_url(url) == expected
+
+    def test_extract_domain_matches_urlsplit(self, validator):
+        """Test the fast host scan agrees with urlsplit on edge cases."""
+        urls = [
+            "HTTPS://Example.COM/path",
+            "https://a.example.com:8080/x?y=/z#f/g",
+            "http://user:pw@Host.com/",
+            "https://example.com?q=/a",
+            "//example.com/relative",
+            "http:///no-host",
+            "https://[::1]/x",
+            "http://ho\tst.com/",
+            "a/b://c",
+            "mailto:someone@example.com",
         ]
-        for url in allowed_urls:
-            assert not validator._has_excluded_extension(
-                url
-            ), f"Should not detect excluded extension in {url}"
+        for url in urls:
+            netloc = urlsplit(url).netloc.lower() or None
+            assert validator.extract_domain(url) == netloc, url
 
-    def test_url_validation_performance(self, validator):
-        """Test URL validation performance with many URLs."""
-        import time
+    def test_extract_domain_interns_hosts(self, validator):
+        """Test pages from the same host share one domain string."""
+        first = validator.extract_domain("https://Example.com/page1")
+        second = validator.extract_domain("https://example.com/page2")
 
-        urls = ["https://example.com/page{}".format(i) for i in range(100)]
+        assert first == "example.com"
+        assert first is second
 
-        start_time = time.time()
-        for url in urls:
-            validator.is_valid_url(url)
-        end_time = time.time()
+    def test_url_validation_performance(self, validator, benchmark):
+        """Benchmark URL validation over a batch of URLs."""
+
+        def validate_all():
+            for url in _VALIDATION_URLS:
+                validator.is_valid_url(url)
 
-        assert end_time - start_time < 1.0, "URL validation should be performant"
+        benchmark(validate_all)
 
     def test_validator_initialization(self, validator):
         """Test URLValidator initialization."""